@@ -1,89 +1,154 @@
 # src/exportAnalysis.py
 
+import multiprocessing
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pac
 from portfolioAnalysis import PortfolioAnalyzer
+from portfolioHoldingDataCleaning import read_cleaned
 
 # Export directory
 EXPORT_DIR = os.path.join("data", "exports")
 os.makedirs(EXPORT_DIR, exist_ok=True)
 
-def export_analysis_results(csv_path, portfolio_name, output_prefix):
+# Quote only string fields when writing CSVs with pyarrow
+CSV_WRITE_OPTIONS = pac.WriteOptions(quoting_style="needed")
+
+def export_analysis_results(clean_path, portfolio_name, output_prefix):
     """
     Run analysis on a portfolio and export results into CSVs
     for Tableau / Power BI integration.
     """
-    df = pd.read_csv(csv_path)
+    df = read_cleaned(clean_path)
 
     analyzer = PortfolioAnalyzer(df, portfolio_name)
+    export_analyzer_results(analyzer, output_prefix)
+
+
+def export_analyzer_results(analyzer, output_prefix):
+    """Export every metric of an already-built PortfolioAnalyzer"""
+    portfolio_name = analyzer.name
 
-    summary = pd.DataFrame([analyzer.summary()])
-    summary.to_csv(os.path.join(EXPORT_DIR, "{}_summary.csv".format(output_prefix)), index=False)
+    # Build every output table first, then write them in a single pass
+    exports = {}
+
+    exports["summary"] = pd.DataFrame([analyzer.summary()])
 
     cd = analyzer.credit_distribution().reset_index()
     cd.columns = ["Rating", "Market Value %"]
     cd["Portfolio"] = portfolio_name
-    cd.to_csv(os.path.join(EXPORT_DIR, "{}_credit_distribution.csv".format(output_prefix)), index=False)
+    exports["credit_distribution"] = cd
 
     ratings = analyzer.rating_distributions()
     for col, dist in ratings.items():
         dist = dist.reset_index()
         dist.columns = ["Rating", "Market Value %"]
         dist["Portfolio"] = portfolio_name
-        dist.to_csv(os.path.join(EXPORT_DIR, "{}_{}_distribution.csv".format(output_prefix, col.replace(' ', '_'))), index=False)
+        exports["{}_distribution".format(col.replace(' ', '_'))] = dist
 
     se = analyzer.sector_exposure().reset_index()
     se.columns = ["Sector", "Market Value %"]
     se["Portfolio"] = portfolio_name
-    se.to_csv(os.path.join(EXPORT_DIR, "{}_sector_exposure.csv".format(output_prefix)), index=False)
+    exports["sector_exposure"] = se
 
     krd = analyzer.krd_profile().reset_index()
     krd.columns = ["Tenor", "Contribution"]
     krd["Portfolio"] = portfolio_name
-    krd.to_csv(os.path.join(EXPORT_DIR, "{}_krd_profile.csv".format(output_prefix)), index=False)
+    exports["krd_profile"] = krd
 
     th = analyzer.top_holdings().reset_index()
     th.columns = ["Issuer", "Market Value"]
     th["Portfolio"] = portfolio_name
-    th.to_csv(os.path.join(EXPORT_DIR, "{}_top_holdings.csv".format(output_prefix)), index=False)
+    exports["top_holdings"] = th
 
-    dur = pd.DataFrame([analyzer.duration()])
-    dur.to_csv(os.path.join(EXPORT_DIR, "{}_duration.csv".format(output_prefix)), index=False)
+    exports["duration"] = pd.DataFrame([analyzer.duration()])
 
     mb = analyzer.maturity_buckets().reset_index()
     mb.columns = ["Maturity Bucket", "Market Value %"]
     mb["Portfolio"] = portfolio_name
-    mb.to_csv(os.path.join(EXPORT_DIR, "{}_maturity_buckets.csv".format(output_prefix)), index=False)
+    exports["maturity_buckets"] = mb
 
     ce = analyzer.currency_exposure().reset_index()
     ce.columns = ["Currency", "Market Value %"]
     ce["Portfolio"] = portfolio_name
-    ce.to_csv(os.path.join(EXPORT_DIR, "{}_currency_exposure.csv".format(output_prefix)), index=False)
+    exports["currency_exposure"] = ce
 
     cat_breaks = analyzer.categorical_breakdowns()
     for col, dist in cat_breaks.items():
         dist = dist.reset_index()
         dist.columns = [col, "Market Value %"]
         dist["Portfolio"] = portfolio_name
-        dist.to_csv(os.path.join(EXPORT_DIR, "{}_{}_breakdown.csv".format(output_prefix, col.replace(' ', '_'))), index=False)
+        exports["{}_breakdown".format(col.replace(' ', '_'))] = dist
+
+    write_exports(EXPORT_DIR, output_prefix, exports)
+
+
+def write_exports(export_dir, output_prefix, exports):
+    """Write each {metric: DataFrame} entry to <export_dir>/<output_prefix>_<metric>.csv"""
+    for metric, frame in exports.items():
+        _fast_to_csv(frame, os.path.join(export_dir, "{}_{}.csv".format(output_prefix, metric)))
+
+
+def _fast_to_csv(df, path):
+    """Write a DataFrame with pyarrow's CSV writer instead of pandas' per-cell formatting"""
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns have no Arrow type; let pandas stringify them
+        df.to_csv(path, index=False)
+        return
+    pac.write_csv(table, path, write_options=CSV_WRITE_OPTIONS)
 
 
 def combine_exports(export_dir, metric_name, files, output_file):
     """Combine multiple CSVs (USD + EUR) into one for Power BI Service"""
-    dfs = []
+    tables = []
     for f in files:
         path = os.path.join(export_dir, f)
         if os.path.exists(path):
-            df = pd.read_csv(path)
-            dfs.append(df)
-    if dfs:
-        combined = pd.concat(dfs, ignore_index=True)
-        combined.to_csv(os.path.join(export_dir, output_file), index=False)
+            tables.append(pac.read_csv(path))
+    if tables:
+        # Arrow concatenation reuses the input buffers instead of copying them
+        combined = pa.concat_tables(tables, promote_options="permissive")
+        pac.write_csv(combined, os.path.join(export_dir, output_file), write_options=CSV_WRITE_OPTIONS)
+
+
+# Analyzers built by the parent process, keyed by output prefix
+_ANALYZERS = {}
+
+
+def _export_prepared(output_prefix):
+    """Process-pool entry point for forked workers, which inherit _ANALYZERS"""
+    export_analyzer_results(_ANALYZERS[output_prefix], output_prefix)
 
 
 if __name__ == "__main__":
-    export_analysis_results("data/clean/PORT_USD_clean.csv", "USD Portfolio", "USD_Portfolio")
-    export_analysis_results("data/clean/PORT_EUR_clean.csv", "EUR Portfolio", "EUR_Portfolio")
+    portfolios = [
+        ("data/clean/PORT_USD_clean.parquet", "USD Portfolio", "USD_Portfolio"),
+        ("data/clean/PORT_EUR_clean.parquet", "EUR Portfolio", "EUR_Portfolio"),
+    ]
+    # Load once in the parent, before the pool starts its workers
+    for path, name, prefix in portfolios:
+        _ANALYZERS[prefix] = PortfolioAnalyzer(read_cleaned(path), name)
+
+    # fork only on Linux: on macOS it is unsafe once pyarrow/BLAS threads are running
+    use_fork = sys.platform.startswith("linux")
+    ctx = multiprocessing.get_context("fork") if use_fork else None
+
+    # Portfolios are independent, so export them in parallel
+    with ProcessPoolExecutor(max_workers=len(_ANALYZERS), mp_context=ctx) as ex:
+        if use_fork:
+            # Workers share the parent's analyzers copy-on-write; only the prefix is sent
+            futures = [ex.submit(_export_prepared, prefix) for prefix in _ANALYZERS]
+        else:
+            futures = [ex.submit(export_analyzer_results, analyzer, prefix)
+                       for prefix, analyzer in _ANALYZERS.items()]
+        for future in futures:
+            future.result()
 
     combine_exports(EXPORT_DIR, "summary", [
         "USD_Portfolio_summary.csv",
@@ -1,16 +1,46 @@
+import functools
+import inspect
+
+import numpy as np
 import pandas as pd
 
+from portfolioHoldingDataCleaning import read_cleaned
+
+
+def _memoize(method):
+    """
+    Cache a method's result on the analyzer instance, keyed by its
+    (default-filled) arguments. The cache lives in ``self._cache``.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+
+    return wrapper
+
+
 class PortfolioAnalyzer:
     """
     Analyze fixed income portfolios for summary stats,
     credit quality, sector exposure, KRD risk profile,
     maturity, duration, and categorical exposures.
+
+    The holdings DataFrame is treated as read-only once the analyzer
+    is built, so every metric is computed once and then served from
+    a per-instance cache.
     """
 
     def __init__(self, df, name="Portfolio"):
-        self.df = df.copy()
+        # shallow rename: shares the caller's data, which is never written to
+        self.df = df.rename(columns=lambda c: c.strip(), copy=False)
         self.name = name
-        self.df.columns = [c.strip() for c in self.df.columns]
 
         self.alias_map = {
             "rating": ["Rating", "Composite Rating", "Moody", "S&P", "Fitch", "MSCI"],
@@ -19,12 +49,40 @@ class PortfolioAnalyzer:
             "currency": ["Currency", "Ccy", "Base Currency", "Trade Currency"]
         }
         self.rating_cols = self._find_cols("rating")  
+        self._rating_priority_cols = None
         self.sector_col = self._get_primary_col(self._find_cols("sector"))
         self.issuer_col = self._get_primary_col(self._find_cols("issuer"))
         self.currency_col = self._get_primary_col(self._find_cols("currency"))
+        self._obj_cols = [
+            c for c in self.df.columns
+            if self.df[c].dtype == object and c not in ("Issuer Name", "Description")
+        ]
+
+        self._cache = {}
+        self._derived = {}
+        self._cats = {}
+        self._prepare()
 
+    def _prepare(self):
+        """
+        Coerce numeric inputs once, before any metric is computed, and keep
+        the Market Value weights and days to maturity as NumPy arrays so the
+        metrics don't repeat the same reductions and date parsing.
+        """
+        self._mv = None
+        self._mv_sum = None
         if "Market Value" in self.df.columns:
-            self.df["Market Value"] = pd.to_numeric(self.df["Market Value"], errors="coerce")
+            mv = pd.to_numeric(self.df["Market Value"], errors="coerce")
+            self._mv = mv.to_numpy(dtype=np.float64)
+            self._mv_sum = np.nansum(self._mv)
+
+        # one reference date per analyzer, shared by summary and maturity_buckets
+        self._today = pd.Timestamp.today()
+        self._mat_days = None
+        if "Maturity" in self.df.columns:
+            maturity = pd.to_datetime(self.df["Maturity"], errors="coerce")
+            self._mat_days = (maturity - self._today).dt.days.to_numpy(dtype=np.float64)
+
     def _find_cols(self, category):
         """Return all matching columns for a category"""
         aliases = self.alias_map.get(category, [])
@@ -34,17 +92,49 @@ class PortfolioAnalyzer:
         """Return the first column if multiple matches are found"""
         return cols[0] if cols else None
 
+    def _column(self, col):
+        """
+        Values of ``col``. The derived Composite Rating always replaces an input
+        column of the same name, so it is built here before anything reads it.
+        """
+        if col == "Composite Rating":
+            self.combined_rating()
+        if col in self._derived:
+            return self._derived[col]
+        return self.df[col]
+
+    def _factorize(self, col):
+        """
+        Integer codes and sorted uniques for ``col``, hashed once per column and
+        shared by every breakdown that groups on it.
+        """
+        if col not in self._cats:
+            codes, uniques = pd.factorize(self._column(col), sort=True)
+            self._cats[col] = (codes.astype(np.int32), uniques)
+        return self._cats[col]
+
+    def _sum_by(self, col):
+        """
+        Market Value summed per value of ``col``. Same result as
+        ``self.df.groupby(col)["Market Value"].sum()``, aggregated with np.bincount.
+        """
+        codes, uniques = self._factorize(col)
+        valid = (codes >= 0) & ~np.isnan(self._mv)
+        totals = np.bincount(codes[valid], weights=self._mv[valid], minlength=len(uniques))
+        return pd.Series(totals, index=pd.Index(uniques, name=col), name="Market Value")
+
+    @_memoize
     def summary(self):
-        total_mv = self.df["Market Value"].sum()
+        total_mv = self._mv_sum
 
         weighted_yield = None
         if "Yield to Worst" in self.df.columns:
-            weighted_yield = (self.df["Yield to Worst"] * self.df["Market Value"]).sum() / total_mv
+            ytw = self.df["Yield to Worst"].to_numpy(dtype=np.float64)
+            weighted_yield = np.nansum(ytw * self._mv) / total_mv
 
         avg_maturity = None
-        if "Maturity" in self.df.columns:
-            avg_maturity = (pd.to_datetime(self.df["Maturity"], errors="coerce") - pd.Timestamp.today()).dt.days.mean()
-            avg_maturity = avg_maturity / 365.0
+        if self._mat_days is not None:
+            avg_maturity = np.nanmean(self._mat_days) / 365.0
 
         return {
             "Portfolio": self.name,
@@ -54,30 +144,40 @@ class PortfolioAnalyzer:
         }
 
     def combined_rating(self):
-        """Build a Composite Rating column from Fitch, Moody's, S&P, MSCI (priority order)"""
+        """
+        Build a Composite Rating column from Fitch, Moody's, S&P, MSCI (priority order).
+        The column is built on the first call; later calls just return its name.
+        """
+        if "Composite Rating" in self._derived:
+            return "Composite Rating"
         if not self.rating_cols:
             return None
 
-        priority = ["Fitch", "Moody", "S&P", "MSCI"]
-
-        def pick_rating(row):
-            for p in priority:
-                for col in self.rating_cols:
-                    if p.lower() in col.lower() and pd.notnull(row[col]):
-                        return row[col]
-            return None
-
-        self.df["Composite Rating"] = self.df.apply(pick_rating, axis=1)
+        if self._rating_priority_cols is None:
+            priority = ["Fitch", "Moody", "S&P", "MSCI"]
+            self._rating_priority_cols = [
+                col for p in priority for col in self.rating_cols if p.lower() in col.lower()
+            ]
+
+        ordered = self._rating_priority_cols
+        if ordered:
+            # first non-null rating across the priority-ordered columns
+            composite = self.df[ordered].bfill(axis=1).iloc[:, 0].to_numpy(dtype=object)
+        else:
+            composite = np.full(len(self.df), None, dtype=object)
+        self._derived["Composite Rating"] = composite
         return "Composite Rating"
 
+    @_memoize
     def credit_distribution(self):
         """Aggregate credit quality distribution using Composite Rating"""
         comp_col = self.combined_rating()
         if comp_col:
-            dist = self.df.groupby(comp_col)["Market Value"].sum()
+            dist = self._sum_by(comp_col)
             return (dist / dist.sum() * 100).sort_index()
         return pd.Series()
 
+    @_memoize
     def rating_distributions(self):
         """
         Return a dictionary of distributions for each rating column found.
@@ -85,72 +185,100 @@ class PortfolioAnalyzer:
         """
         results = {}
         for col in self.rating_cols:
-            dist = self.df.groupby(col)["Market Value"].sum()
+            dist = self._sum_by(col)
             results[col] = (dist / dist.sum() * 100).sort_index()
         return results
 
+    @_memoize
     def sector_exposure(self):
         if self.sector_col:
-            exp = self.df.groupby(self.sector_col)["Market Value"].sum()
+            exp = self._sum_by(self.sector_col)
             return (exp / exp.sum() * 100).sort_values(ascending=False)
         return pd.Series()
 
+    @_memoize
     def krd_profile(self):
         krd_cols = [c for c in self.df.columns if "KRD Contribution" in c]
         if not krd_cols:
             return pd.Series()
 
-        krd_weighted = self.df[krd_cols].multiply(self.df["Market Value"], axis=0).sum()
-        return krd_weighted / self.df["Market Value"].sum()
+        # MV-weighted column sums as one matrix-vector product, no N x K temporary;
+        # float32 halves the bytes it streams (monetary totals stay in float64)
+        values = self.df[krd_cols].to_numpy(dtype=np.float32)
+        if np.isnan(values).any():
+            values = np.where(np.isnan(values), np.float32(0), values)
+        mv32 = np.nan_to_num(self._mv).astype(np.float32)
+        krd_weighted = (mv32 @ values).astype(np.float64)
+        return pd.Series(krd_weighted / self._mv_sum, index=krd_cols)
 
+    @_memoize
     def top_holdings(self, n=10):
         if self.issuer_col:
-            return self.df.groupby(self.issuer_col)["Market Value"].sum().nlargest(n)
+            totals = self._sum_by(self.issuer_col)
+            values = totals.to_numpy()
+            idx = np.arange(len(values))
+            if 0 < n < len(values):
+                # partial selection finds the n-th largest value; keep everything
+                # tied with it so the stable sort can break ties by issuer order
+                threshold = values[np.argpartition(-values, n - 1)[n - 1]]
+                idx = np.flatnonzero(values >= threshold)
+            idx = idx[np.argsort(-values[idx], kind="stable")][:max(n, 0)]
+            return totals.iloc[idx]
         return pd.Series([], name="No Issuer Column Found")
 
+    @_memoize
     def duration(self):
         dur_col = next((c for c in self.df.columns if "duration" in c.lower()), None)
         if dur_col:
-            weighted_dur = (self.df[dur_col] * self.df["Market Value"]).sum() / self.df["Market Value"].sum()
+            dur = self.df[dur_col].to_numpy(dtype=np.float64)
+            weighted_dur = np.nansum(dur * self._mv) / self._mv_sum
             return {"Portfolio": self.name, "Weighted Duration": float(weighted_dur)}
         return {"Portfolio": self.name, "Weighted Duration": None}
 
+    @_memoize
     def maturity_buckets(self):
         if "Maturity" not in self.df.columns:
             return pd.Series([], name="No Maturity Column Found")
 
-        today = pd.Timestamp.today()
-        self.df["Maturity Date"] = pd.to_datetime(self.df["Maturity"], errors="coerce")
-        self.df["Years to Maturity"] = (self.df["Maturity Date"] - today).dt.days / 365.0
-
-        bins = [0, 3, 5, 10, 30, 100]
+        years = self._mat_days / 365.0
+        bins = np.array([0, 3, 5, 10, 30, 100], dtype=np.float64)
         labels = ["0-3y", "3-5y", "5-10y", "10-30y", "30y+"]
-        self.df["Maturity Bucket"] = pd.cut(self.df["Years to Maturity"], bins=bins, labels=labels, right=False)
 
-        dist = self.df.groupby("Maturity Bucket", observed=False)["Market Value"].sum()
-        return (dist / dist.sum() * 100).sort_index()
+        # left-closed buckets [0, 3), [3, 5), ...; anything outside (or NaN) is dropped
+        idx = np.searchsorted(bins, years, side="right") - 1
+        mask = (idx >= 0) & (idx < len(labels)) & ~np.isnan(self._mv)
+        totals = np.bincount(idx[mask], weights=self._mv[mask], minlength=len(labels))
+
+        dist = pd.Series(totals, index=pd.Index(labels, name="Maturity Bucket"), name="Market Value")
+        return dist / dist.sum() * 100
 
+    @_memoize
     def currency_exposure(self):
         if self.currency_col:
-            exp = self.df.groupby(self.currency_col)["Market Value"].sum()
+            exp = self._sum_by(self.currency_col)
             return (exp / exp.sum() * 100).sort_values(ascending=False)
         return pd.Series([], name="No Currency Column Found")
 
+    @_memoize
     def categorical_breakdowns(self, top_n=10):
         """
-        Return breakdowns of all non-numeric columns (besides IDs),
-        weighted by Market Value.
+        Return breakdowns of all non-numeric columns (besides IDs)
+        plus the Composite Rating, weighted by Market Value.
         """
+        cols = list(self._obj_cols)
+        comp_col = self.combined_rating()
+        if comp_col and comp_col not in cols:
+            cols.append(comp_col)
+
         results = {}
-        for col in self.df.select_dtypes(include="object").columns:
-            if col not in ["Issuer Name", "Description"]:
-                dist = self.df.groupby(col)["Market Value"].sum()
-                results[col] = (dist / dist.sum() * 100).sort_values(ascending=False).head(top_n)
+        for col in cols:
+            dist = self._sum_by(col)
+            results[col] = (dist / dist.sum() * 100).sort_values(ascending=False).head(top_n)
         return results
 
 if __name__ == "__main__":
-    usd_port = pd.read_csv("data/clean/PORT_USD_clean.csv")
-    eur_port = pd.read_csv("data/clean/PORT_EUR_clean.csv")
+    usd_port = read_cleaned("data/clean/PORT_USD_clean.parquet")
+    eur_port = read_cleaned("data/clean/PORT_EUR_clean.parquet")
 
     usd_analyzer = PortfolioAnalyzer(usd_port, "USD Portfolio")
     eur_analyzer = PortfolioAnalyzer(eur_port, "EUR Portfolio")
@@ -2,6 +2,42 @@ import pandas as pd
 import re
 from pathlib import Path
 
+# Parse cleaned CSVs with pyarrow's multi-threaded reader instead of pandas' parser
+USE_ARROW_CSV = True
+
+
+def _fast_read_csv(path):
+    """
+    Read a CSV with pyarrow when USE_ARROW_CSV is set and pyarrow is available,
+    otherwise fall back to pandas. Columns come back as regular NumPy dtypes.
+    """
+    if USE_ARROW_CSV:
+        try:
+            import pyarrow.csv as pac
+        except ImportError:
+            pass
+        else:
+            table = pac.read_csv(
+                path,
+                read_options=pac.ReadOptions(use_threads=True),
+                convert_options=pac.ConvertOptions(strings_can_be_null=True),
+            )
+            return table.to_pandas()
+    return pd.read_csv(path)
+
+
+def read_cleaned(path):
+    """
+    Read a cleaned portfolio file written by PortfolioLoader.save_cleaned.
+    Falls back to the legacy CSV with the same name if the Parquet file is missing.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet" and not path.exists():
+        path = path.with_suffix(".csv")
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, engine="pyarrow")
+    return _fast_read_csv(path)
+
 
 class PortfolioLoader:
     def __init__(self, data_dir="data", raw_filename="Portfolio_holdings.xlsx"):
@@ -27,9 +63,8 @@ class PortfolioLoader:
         Load a portfolio sheet and do some basic cleaning.
         Note: The Excel file has extra rows before the real header (start at row 5).
         """
-        df = pd.read_excel(self.raw_file, sheet_name=sheet_name, header=4)
-        df.columns = df.iloc[0]
-        df = df.drop(0).reset_index(drop=True)
+        # header=5 points at the real header row, so read_excel infers the column dtypes itself
+        df = pd.read_excel(self.xls, sheet_name=sheet_name, header=5)
         df.columns = [str(c).strip() for c in df.columns]
 
         krd_cols = [c for c in df.columns if re.match(r"^\d+[MY]$", str(c).strip())]
@@ -39,21 +74,25 @@ class PortfolioLoader:
         if "Maturity" in df.columns:
             df["Maturity"] = pd.to_datetime(df["Maturity"], errors="coerce")
 
-        for col in df.columns:
-            if col not in ["CUSIP", "Security Description", "Ticker"]:
-                try:
-                    df[col] = pd.to_numeric(df[col])
-                except (ValueError, TypeError):
-                    pass
+        # Only columns the reader left non-numeric still need coercing
+        text_cols = ["CUSIP", "Security Description", "Ticker"]
+        for col in df.columns.difference(text_cols, sort=False):
+            if pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            try:
+                df[col] = pd.to_numeric(df[col])
+            except (ValueError, TypeError):
+                pass
 
         return df
 
     def save_cleaned(self, df, name):
         """
-        Save cleaned DataFrame to /data/clean folder.
+        Save cleaned DataFrame to /data/clean folder as Parquet,
+        which keeps the dtypes resolved in load_and_clean.
         """
-        output_file = self.clean_dir / "{}_clean.csv".format(name)
-        df.to_csv(output_file, index=False)
+        output_file = self.clean_dir / "{}_clean.parquet".format(name)
+        df.to_parquet(output_file, engine="pyarrow", compression="snappy", index=False)
         print("Saved cleaned file: {}".format(output_file))
 
 
@@ -2,22 +2,26 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 from portfolioAnalysis import PortfolioAnalyzer
+from portfolioHoldingDataCleaning import read_cleaned
 
-@st.cache_data
+@st.cache_resource
 def load_portfolio(file_path, portfolio_name):
-    df = pd.read_csv(file_path)
+    df = read_cleaned(file_path)
     return PortfolioAnalyzer(df, portfolio_name)
 
 st.set_page_config(page_title="Portfolio Analysis Dashboard", layout="wide")
 
-st.title("BlackRock Fixed Income Portfolio Analysis")
+# Analyzers are cached as shared resources, so both are built once and their
+# memoized metrics survive reruns and sessions
+ANALYZERS = {
+    "USD Portfolio": load_portfolio("data/clean/PORT_USD_clean.parquet", "USD Portfolio"),
+    "EUR Portfolio": load_portfolio("data/clean/PORT_EUR_clean.parquet", "EUR Portfolio"),
+}
 
-portfolio_choice = st.sidebar.radio("Select Portfolio", ["USD Portfolio", "EUR Portfolio"])
+st.title("BlackRock Fixed Income Portfolio Analysis")
 
-if portfolio_choice == "USD Portfolio":
-    analyzer = load_portfolio("data/clean/PORT_USD_clean.csv", "USD Portfolio")
-else:
-    analyzer = load_portfolio("data/clean/PORT_EUR_clean.csv", "EUR Portfolio")
+portfolio_choice = st.sidebar.radio("Select Portfolio", list(ANALYZERS))
+analyzer = ANALYZERS[portfolio_choice]
 
 analysis_choice = st.sidebar.selectbox(
     "Select Analysis",